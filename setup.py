@@ -1,16 +1,25 @@
+from pathlib import Path
 from setuptools import setup, find_packages
 
+here = Path(__file__).parent
+long_description = (here / "README.md").read_text(encoding="utf-8")
+install_requires = [
+    line.strip()
+    for line in (here / "requirements.txt").read_text(encoding="utf-8").splitlines()
+    if line.strip() and not line.strip().startswith("#")
+]
+
 setup(
     name="pluseposter",
     version="0.1.0",
     description="A Python automation tool for social media posting",
-    long_description=open("README.md").read(),
+    long_description=long_description,
     long_description_content_type="text/markdown",
     author="Kofidell4545",
     url="https://github.com/Kofidell4545/PlusePoster",
     packages=find_packages("src"),
     package_dir={"": "src"},
-    install_requires=open("requirements.txt").readlines(),
+    install_requires=install_requires,
     python_requires=">=3.10",
     entry_points={
         "console_scripts": [
@@ -1,6 +1,16 @@
-from .pluseposter import PlusePoster
-from .config import Config
 from .utils import logger
 
 __version__ = "0.1.0"
 __all__ = ["PlusePoster", "Config"]
+
+
+def __getattr__(name):
+    # Resolve the public classes lazily so importing the package (e.g. for
+    # the CLI) doesn't pull in pydantic, yaml and the platform SDKs up front
+    if name == "PlusePoster":
+        from .pluseposter import PlusePoster
+        return PlusePoster
+    if name == "Config":
+        from .config import Config
+        return Config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,17 @@
 import argparse
 import asyncio
-from datetime import datetime
+import importlib
 import logging
+import re
+import sys
 from pathlib import Path
 from typing import Optional
-from .pluseposter import PlusePoster
+from .platforms import PLATFORM_CLASSES
 from .utils import setup_logging
 
+# Trailing "Z" (UTC) suffix, which datetime.fromisoformat() rejects before 3.11
+_ISO_Z = re.compile(r"Z$")
+
 def parse_args() -> argparse.Namespace:
     """
     📱 Parse command line arguments
@@ -22,7 +27,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--platform",
         required=True,
-        choices=["twitter", "instagram", "facebook"],
+        choices=list(PLATFORM_CLASSES),
         help="""
         🌐 Select which social media platform to post to:
         - twitter: Post to Twitter/X
@@ -69,8 +74,9 @@ def parse_args() -> argparse.Namespace:
         "--schedule",
         help="""
         📅 Schedule your post for a future time:
-        - Format: YYYY-MM-DDTHH:MM:SS
+        - Format: YYYY-MM-DDTHH:MM:SS (UTC unless an offset is given)
         - Example: 2025-07-01T09:00:00Z
+        - The command keeps running until then, and posts at that time
         """
     )
     
@@ -92,28 +98,41 @@ async def main():
     args = parse_args()
     setup_logging(args.debug)
     
-    # Initialize PlusePoster
-    poster = PlusePoster()
+    # Initialize only the selected platform
+    from .config import Config
+    platform_config = getattr(Config.from_env(), args.platform)
+    if platform_config is None:
+        logging.error(f"Platform '{args.platform}' is not configured")
+        sys.exit(1)
+    module = importlib.import_module(f".platforms.{args.platform}", package=__package__)
+    platform = getattr(module, PLATFORM_CLASSES[args.platform])(platform_config)
     
     # Prepare content
     content = args.file if args.type in ["image", "video"] else args.caption
     
     # Convert schedule time if provided
-    scheduled_time = datetime.fromisoformat(args.schedule) if args.schedule else None
+    scheduled_time = None
+    if args.schedule:
+        from datetime import datetime
+        scheduled_time = datetime.fromisoformat(_ISO_Z.sub("+00:00", args.schedule))
     
     try:
-        # Post or schedule the content
-        result = await poster.post(
-            platform=args.platform,
+        # Wait here for every platform; Facebook's own background queue
+        # would be dropped when this process exits
+        await platform._handle_scheduling(scheduled_time)
+        result = await platform.post(
             content_type=args.type,
             content=content,
             caption=args.caption,
-            scheduled_time=scheduled_time,
         )
         print(f"Success! Response: {result}")
     except Exception as e:
         logging.error(f"Error posting content: {str(e)}")
         sys.exit(1)
+    finally:
+        from .session import close_session
+        await platform.close()
+        await close_session()
 
 if __name__ == "__main__":
     asyncio.run(main())
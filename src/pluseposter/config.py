@@ -1,26 +1,95 @@
 import os
+import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import yaml
-from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from dotenv import find_dotenv, load_dotenv
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# ${VAR} references expanded from the environment when loading YAML
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+
+# LRU cache of parsed YAML configs:
+# resolved path -> (mtime, size, referenced env var names, their values, Config)
+_YAML_CACHE: "OrderedDict[str, Tuple[float, int, Tuple[str, ...], Tuple[Optional[str], ...], Config]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+# Environment variables read by Config.from_env()
+_ENV_VARS = (
+    "TWITTER_API_KEY",
+    "TWITTER_API_SECRET",
+    "TWITTER_ACCESS_TOKEN",
+    "TWITTER_ACCESS_TOKEN_SECRET",
+    "INSTAGRAM_API_KEY",
+    "INSTAGRAM_API_SECRET",
+    "FACEBOOK_API_KEY",
+    "FACEBOOK_API_SECRET",
+)
+
+# Last config built from the environment:
+# (.env path, .env mtime, values of _ENV_VARS, Config)
+_ENV_CACHE: Optional[Tuple[str, Optional[float], Tuple[Optional[str], ...], "Config"]] = None
 
 class PlatformConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     api_key: str
     api_secret: str
     access_token: Optional[str] = None
     access_token_secret: Optional[str] = None
 
 class Config(BaseModel):
+    """
+    Credentials for each configured platform
+
+    Instances are frozen and may be shared between callers (the loaders
+    return cached instances directly). To change a value, derive a new
+    config with ``config.copy_with(update={...})``.
+    """
+    model_config = ConfigDict(frozen=True)
+
     twitter: Optional[PlatformConfig] = None
     instagram: Optional[PlatformConfig] = None
     facebook: Optional[PlatformConfig] = None
 
+    _dict_cache: Optional[Dict[str, Dict[str, Any]]] = PrivateAttr(default=None)
+
     @classmethod
     def from_env(cls) -> "Config":
-        """Load configuration from environment variables"""
-        load_dotenv()
-        return cls(
+        """
+        Load configuration from environment variables
+
+        The result is cached and reused until the ``.env`` file changes
+        (by mtime) or one of the platform variables in the environment
+        does; the frozen instance is returned without copying.
+        Variables from ``.env`` take precedence over the process
+        environment so that edits are picked up on reload.
+        """
+        global _ENV_CACHE
+        dotenv_path = find_dotenv()
+        try:
+            mtime = os.stat(dotenv_path).st_mtime if dotenv_path else None
+        except OSError:
+            mtime = None
+
+        if (
+            _ENV_CACHE
+            and _ENV_CACHE[0] == dotenv_path
+            and _ENV_CACHE[1] == mtime
+            and _ENV_CACHE[2] == tuple(os.environ.get(name) for name in _ENV_VARS)
+        ):
+            return _ENV_CACHE[3]
+
+        if dotenv_path:
+            load_dotenv(dotenv_path, override=True)
+        config = cls(
             twitter=PlatformConfig(
                 api_key=os.getenv("TWITTER_API_KEY"),
                 api_secret=os.getenv("TWITTER_API_SECRET"),
@@ -36,14 +105,90 @@ class Config(BaseModel):
                 api_secret=os.getenv("FACEBOOK_API_SECRET"),
             ) if os.getenv("FACEBOOK_API_KEY") else None,
         )
+        env_values = tuple(os.environ.get(name) for name in _ENV_VARS)
+        _ENV_CACHE = (dotenv_path, mtime, env_values, config)
+        return config
+
+    @staticmethod
+    def invalidate_env_cache() -> None:
+        """Drop the cached result of from_env()"""
+        global _ENV_CACHE
+        _ENV_CACHE = None
 
     @classmethod
     def from_yaml(cls, path: Path) -> "Config":
-        """Load configuration from YAML file"""
-        with open(path, "r") as f:
-            config_data = yaml.safe_load(f)
-        return cls(**config_data)
+        """
+        Load configuration from YAML file
+
+        ``${VAR}`` references in string values are replaced with the value
+        of the matching environment variable after parsing, so values may
+        contain any characters; unset variables are left untouched. Parsed
+        configs are cached by resolved path and reused for as long as the
+        file's mtime and size and the referenced variables are unchanged.
+        The returned instance is shared with the cache, which is safe
+        because configs are frozen.
+        """
+        path = Path(path)
+        st = path.stat()
+        key = str(path.resolve())
+
+        cached = _YAML_CACHE.get(key)
+        if (
+            cached
+            and cached[0] == st.st_mtime
+            and cached[1] == st.st_size
+            and cached[3] == tuple(os.environ.get(name) for name in cached[2])
+        ):
+            _YAML_CACHE.move_to_end(key)
+            return cached[4]
+
+        text = path.read_bytes().decode()
+        config_data = yaml.load(text, Loader=_Loader)
+        names: Tuple[str, ...] = ()
+        if "${" in text:
+            names = tuple(sorted(set(_ENV_VAR_RE.findall(text))))
+            config_data = _interpolate(config_data)
+        config = cls(**config_data)
+
+        env_values = tuple(os.environ.get(name) for name in names)
+        _YAML_CACHE[key] = (st.st_mtime, st.st_size, names, env_values, config)
+        _YAML_CACHE.move_to_end(key)
+        if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+        return config
+
+    def copy_with(self, update: Optional[Dict[str, Any]] = None) -> "Config":
+        """
+        Return a new config with ``update`` applied
+
+        ``update`` replaces top-level fields and is validated like any other
+        input, so platform sections may be given as plain dicts. The result
+        is frozen too; configs are never modified in place.
+        """
+        return type(self).model_validate({**self.model_dump(), **(update or {})})
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert configuration to dictionary"""
-        return self.dict(exclude_none=True)
+        """
+        Convert configuration to dictionary
+
+        The config is immutable, so the dump is computed once per instance;
+        each call returns a fresh copy of it.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self.model_dump(exclude_none=True)
+        return {name: dict(values) for name, values in self._dict_cache.items()}
+
+
+def _interpolate(data: Any) -> Any:
+    """Expand ${VAR} references in the string values of parsed YAML data"""
+    if isinstance(data, str):
+        if "${" not in data:
+            return data
+        return _ENV_VAR_RE.sub(
+            lambda match: os.environ.get(match.group(1), match.group(0)), data
+        )
+    if isinstance(data, dict):
+        return {key: _interpolate(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_interpolate(value) for value in data]
+    return data
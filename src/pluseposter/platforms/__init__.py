@@ -0,0 +1,7 @@
+# Platform module name -> class name. Platform modules are imported only when
+# that platform is used, so unused SDKs are never loaded.
+PLATFORM_CLASSES = {
+    "twitter": "TwitterPlatform",
+    "instagram": "InstagramPlatform",
+    "facebook": "FacebookPlatform",
+}
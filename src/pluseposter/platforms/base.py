@@ -1,7 +1,14 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
+from pathlib import Path
+import asyncio
 import logging
+from ..utils import validate_file_path
+
+logger = logging.getLogger("pluseposter")
+
+MEDIA_TYPES = frozenset({"image", "video"})  # content types backed by a media file
 
 
 class Platform(ABC):
@@ -13,7 +20,6 @@ class Platform(ABC):
             config (Dict[str, Any]): Platform-specific configuration
         """
         self.config = config
-        self.logger = logging.getLogger(__name__)
 
     @abstractmethod
     async def post(
@@ -30,17 +36,25 @@ class Platform(ABC):
             content_type (str): Type of content (text, image, video)
             content (Any): Content to post
             caption (Optional[str]): Caption for the post
-            scheduled_time (Optional[datetime]): Time to schedule the post
+            scheduled_time (Optional[datetime]): UTC time to schedule the post.
+                Unless the platform queues posts itself, the call waits
+                until this time and then posts
             
         Returns:
             Dict[str, Any]: Response from the platform
         """
         pass
 
-    async def _validate_content(self, content_type: str, content: Any) -> bool:
+    def _validate_content(self, content_type: str, content: Any) -> bool:
         """
         Validate the content before posting
         
+        Text posts are accepted as-is; image and video posts must point at
+        an existing file. The check goes through validate_file_path, whose
+        cached result the platform's own validate_file_path call reuses, so
+        the file is only stat'ed once. Unknown content types are left for
+        the platform to reject.
+        
         Args:
             content_type (str): Type of content
             content (Any): Content to validate
@@ -48,16 +62,35 @@ class Platform(ABC):
         Returns:
             bool: True if content is valid
         """
-        # TODO: Implement content validation
+        if content_type == "text":
+            return True
+        if content_type in MEDIA_TYPES:
+            if not isinstance(content, (str, Path)):
+                return False
+            try:
+                validate_file_path(str(content))
+            except ValueError:
+                return False
+            return True
         return True
 
     async def _handle_scheduling(self, scheduled_time: Optional[datetime]) -> None:
         """
-        Handle post scheduling
+        Handle post scheduling by waiting until the scheduled time
+        
+        Naive datetimes are taken as UTC, as on Facebook. The wall-clock
+        delay is computed once and handed to asyncio.sleep, which runs on
+        the loop's monotonic clock, so clock adjustments while waiting don't
+        shift the post.
         
         Args:
-            scheduled_time (Optional[datetime]): Time to schedule the post
+            scheduled_time (Optional[datetime]): UTC time to schedule the post
         """
         if scheduled_time:
-            # TODO: Implement scheduling logic
-            pass
+            if scheduled_time.tzinfo is None:
+                scheduled_time = scheduled_time.replace(tzinfo=timezone.utc)
+            now = datetime.now(timezone.utc)
+            delay = max(0.0, (scheduled_time - now).total_seconds())
+            if delay:
+                logger.info(f"Waiting {delay:.0f}s until scheduled time {scheduled_time}")
+                await asyncio.sleep(delay)
@@ -1,18 +1,59 @@
-from typing import Dict, Any, Optional, List, Tuple, Deque
-from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, List, Set, Tuple
+from datetime import datetime, timezone
+import aiofiles
 import aiohttp
 import asyncio
+import itertools
 import logging
+import orjson
+import os
+import random
 import time
-from collections import deque
-from functools import lru_cache
-from heapq import heappush, heappop
+import weakref
+from collections import OrderedDict
+from heapq import heapify, heappush, heappop
 from facebook import GraphAPI
-from .base import Platform
+from .base import MEDIA_TYPES, Platform
+from ..session import get_session
+from ..utils import format_datetime, validate_file_path
+
+logger = logging.getLogger("pluseposter.facebook")
+
+MEDIA_CACHE_SIZE = 128  # max memoized media uploads per platform instance
+GRAPH_VIDEO_URL = "https://graph-video.facebook.com/me/videos"
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_RETRY_DELAY = 60.0  # cap for the exponential backoff, in seconds
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """
+    Return the Retry-After delay in seconds carried by an HTTP error, if any
+
+    Only errors from our own aiohttp requests (aiohttp.ClientResponseError)
+    carry response headers; facebook-sdk's GraphAPIError doesn't expose them.
+    """
+    if not isinstance(error, aiohttp.ClientResponseError) or not error.headers:
+        return None
+    try:
+        return float(error.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None  # missing, or the HTTP-date form
+
+
+async def _read_chunks(file_path: str, chunk_size: int = UPLOAD_CHUNK_SIZE):
+    """Yield a file's contents in chunks without blocking the event loop"""
+    async with aiofiles.open(file_path, 'rb') as f:
+        while True:
+            chunk = await f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
 
 
 class RateLimiter:
     """Token bucket rate limiter implementation"""
+    __slots__ = ("rate", "capacity", "tokens", "last_update", "_lock")
+
     def __init__(self, rate: int, capacity: int):
         self.rate = rate  # tokens per second
         self.capacity = capacity  # max tokens in bucket
@@ -21,79 +62,88 @@ class RateLimiter:
         self._lock = asyncio.Lock()
 
     async def acquire(self, tokens: int = 1) -> float:
-        """Acquire tokens, waiting if necessary"""
+        """
+        Acquire tokens, waiting if necessary
+
+        Tokens are deducted immediately under the lock; if that leaves the
+        bucket in debt, the caller sleeps (outside the lock) until the debt
+        would have been refilled. Later callers see the debt and queue
+        behind it, so waiters are served in arrival order.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        if tokens > self.capacity:
+            raise ValueError("Requested tokens exceed capacity")
+
         async with self._lock:
             now = time.monotonic()
             time_passed = now - self.last_update
             self.tokens = min(self.capacity, self.tokens + time_passed * self.rate)
             self.last_update = now
-            
-            if tokens > self.capacity:
-                raise ValueError("Requested tokens exceed capacity")
-                
-            if self.tokens < tokens:
-                sleep_time = (tokens - self.tokens) / self.rate
-                await asyncio.sleep(sleep_time)
-                return await self.acquire(tokens)
-                
             self.tokens -= tokens
-            return 0
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
 
-class ConnectionPool:
-    """Connection pool for HTTP sessions"""
-    def __init__(self, size: int = 10):
-        self.size = size
-        self._pool: Deque[aiohttp.ClientSession] = deque()
-        self._lock = asyncio.Lock()
-        
-    async def get_session(self) -> aiohttp.ClientSession:
-        """Get a session from the pool"""
-        async with self._lock:
-            if self._pool:
-                return self._pool.popleft()
-            return aiohttp.ClientSession()
-            
-    async def release_session(self, session: aiohttp.ClientSession):
-        """Return a session to the pool"""
-        async with self._lock:
-            if len(self._pool) < self.size:
-                self._pool.append(session)
-            else:
-                await session.close()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next `seconds`, e.g. after a server Retry-After"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_update) * self.rate)
+        self.last_update = now
+        self.tokens = min(self.tokens, -seconds * self.rate)
 
 class FacebookPlatform(Platform):
     """
     Facebook platform implementation using facebook-sdk with advanced features:
-    - Connection pooling
+    - HTTP session and keep-alive connection pool shared with other platforms
     - Rate limiting
     - Request retry with exponential backoff
     - LRU caching for media uploads
     - Batch processing
-    - Priority queue for scheduled posts
+    - Priority queue for scheduled posts, processed by one background
+      task shared by all instances
     """
+    # Shared scheduler state, started lazily by _ensure_scheduler()
+    # min-heap of (monotonic deadline, seq, platform, post_data)
+    _scheduled_posts: List[Tuple[float, int, "FacebookPlatform", Dict[str, Any]]] = []
+    _scheduled_lock: Optional[asyncio.Lock] = None
+    _scheduled_task: Optional[asyncio.Task] = None
+    _scheduled_loop: Optional[asyncio.AbstractEventLoop] = None  # loop owning the lock, event and task
+    _scheduled_seq = itertools.count()  # heap tie-breaker
+    _wake: Optional[asyncio.Event] = None  # set when a post is pushed onto the heap
+    _post_tasks: Set[asyncio.Task] = set()  # strong refs to due posts being published
+    _instances: "weakref.WeakSet[FacebookPlatform]" = weakref.WeakSet()
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        self.logger = logging.getLogger("pluseposter.facebook")
         self.graph = None
         self.rate_limiter = RateLimiter(rate=5, capacity=10)  # 5 requests per second, burst of 10
-        self.connection_pool = ConnectionPool(size=10)
-        self._scheduled_posts = []  # min-heap for scheduled posts
-        self._scheduled_lock = asyncio.Lock()
+        # (path, mtime, size, media_type) -> future resolving to the media ID
+        self._media_cache: "OrderedDict[Tuple[str, float, int, str], asyncio.Future]" = OrderedDict()
         self._ensure_graph()
-        
-        # Start background task for processing scheduled posts
-        self._scheduled_task = asyncio.create_task(self._process_scheduled_posts())
+        FacebookPlatform._instances.add(self)
 
     def _ensure_graph(self):
         """Initialize or get Facebook Graph API instance"""
         if not self.graph:
             self.graph = GraphAPI(access_token=self.config.api_key)
 
-    @lru_cache(maxsize=128)
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared aiohttp session"""
+        return await get_session()
+
     async def _upload_media(self, file_path: str, media_type: str) -> str:
         """
         Upload media to Facebook with caching and retry logic
         
+        Uploads are memoized per (path, mtime, size, media_type), so the same
+        unchanged file is only sent once; concurrent callers for the same
+        file share a single in-flight upload. If the caller running that
+        upload is cancelled, the others start it again.
+        
         Args:
             file_path (str): Path to media file
             media_type (str): Type of media (image, video)
@@ -101,63 +151,195 @@ class FacebookPlatform(Platform):
         Returns:
             str: Media ID from Facebook
         """
+        st = await asyncio.to_thread(os.stat, file_path)  # keep the syscall off the loop
+        key = (str(file_path), st.st_mtime, st.st_size, media_type)
+        
+        while True:
+            cached = self._media_cache.get(key)
+            if cached is None:
+                break
+            self._media_cache.move_to_end(key)
+            try:
+                return await asyncio.shield(cached)
+            except asyncio.CancelledError:
+                if not cached.cancelled():
+                    raise  # this caller was cancelled
+                # The caller that owned the upload was cancelled, not us;
+                # join or start a fresh upload instead of failing this post
+        
+        fut = asyncio.get_running_loop().create_future()
+        self._media_cache[key] = fut
+        if len(self._media_cache) > MEDIA_CACHE_SIZE:
+            self._media_cache.popitem(last=False)
+        
+        try:
+            media_id = await self._upload_media_with_retry(file_path, media_type)
+        except BaseException as e:
+            if self._media_cache.get(key) is fut:
+                del self._media_cache[key]
+            if isinstance(e, asyncio.CancelledError):
+                fut.cancel()
+            else:
+                fut.set_exception(e)
+                fut.exception()  # mark retrieved; waiters still receive it
+            raise
+        
+        fut.set_result(media_id)
+        return media_id
+
+    async def _upload_media_with_retry(self, file_path: str, media_type: str) -> str:
+        """Upload media to Facebook, retrying with exponential backoff"""
         max_retries = 3
         base_delay = 1.0  # Start with 1 second delay
         
         for attempt in range(max_retries):
             try:
                 await self.rate_limiter.acquire()
-                session = await self.connection_pool.get_session()
                 
-                try:
-                    with open(file_path, 'rb') as f:
-                        if media_type == "image":
-                            result = self.graph.put_photo(
-                                image=f,
-                                published=False
-                            )
-                        else:  # video
-                            result = self.graph.put_video(
-                                video_file=f,
-                                published=False
-                            )
-                        return result['id']
-                finally:
-                    await self.connection_pool.release_session(session)
+                if media_type == "video":
+                    # facebook-sdk has no video upload; post to the video endpoint directly
+                    result = await self._upload_video_stream(file_path)
+                else:
+                    # facebook-sdk is blocking; keep file reads and the HTTP call off the loop
+                    result = await asyncio.to_thread(self._put_photo, file_path)
+                return result['id']
                     
             except Exception as e:
                 if attempt == max_retries - 1:  # Last attempt
-                    self.logger.error(f"Facebook media upload failed after {max_retries} attempts: {str(e)}")
+                    logger.error(f"Facebook media upload failed after {max_retries} attempts: {str(e)}")
                     raise
                     
-                # Exponential backoff
-                delay = base_delay * (2 ** attempt)
-                self.logger.warning(f"Attempt {attempt + 1} failed, retrying in {delay:.1f}s: {str(e)}")
+                # Exponential backoff with full jitter, honouring Retry-After
+                delay = self._retry_delay(attempt, base_delay, e)
+                logger.warning(f"Attempt {attempt + 1} failed, retrying in {delay:.1f}s: {str(e)}")
                 await asyncio.sleep(delay)
 
-    async def _process_scheduled_posts(self):
-        """Background task to process scheduled posts"""
+    def _retry_delay(self, attempt: int, base_delay: float, error: Exception) -> float:
+        """
+        Compute the sleep before the next retry
+        
+        Uses full jitter over a capped exponential backoff so concurrent
+        retries spread out. If the server sent Retry-After, the shared rate
+        limiter is paused for that long so every request on this platform
+        backs off, not just the one that failed. Retry-After is only
+        available for requests made over aiohttp (video uploads), not for
+        facebook-sdk calls.
+        """
+        delay = random.uniform(0, min(MAX_RETRY_DELAY, base_delay * (2 ** attempt)))
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            self.rate_limiter.pause(retry_after)
+            delay = max(delay, retry_after)
+        return delay
+
+    def _put_photo(self, file_path: str) -> Dict[str, Any]:
+        """Blocking upload of an image via the Graph API (runs in a worker thread)"""
+        with open(file_path, 'rb') as f:
+            return self.graph.put_photo(
+                image=f,
+                published=False
+            )
+
+    async def _upload_video_stream(self, file_path: str) -> Dict[str, Any]:
+        """
+        Stream a video to the Graph API over the shared aiohttp session
+        
+        The file is sent as a chunked multipart body, so memory use stays at
+        one chunk regardless of the video size.
+        
+        Args:
+            file_path (str): Path to video file
+            
+        Returns:
+            Dict[str, Any]: Graph API response containing the video ID
+        """
+        session = await self._get_session()
+        with aiohttp.MultipartWriter("form-data") as writer:
+            published = writer.append("false")
+            published.set_content_disposition("form-data", name="published")
+            source = writer.append(_read_chunks(file_path))
+            source.set_content_disposition(
+                "form-data", name="source", filename=os.path.basename(file_path)
+            )
+        
+        async with session.post(
+            GRAPH_VIDEO_URL,
+            data=writer,
+            headers={"Authorization": f"Bearer {self.config.api_key}"},
+        ) as resp:
+            body = await resp.read()
+            if resp.status != 200:
+                # Keeps the response headers so _retry_after can see Retry-After
+                raise aiohttp.ClientResponseError(
+                    resp.request_info,
+                    resp.history,
+                    status=resp.status,
+                    message=f"Facebook API error: {body.decode(errors='replace')}",
+                    headers=resp.headers,
+                )
+            return orjson.loads(body)
+
+    @classmethod
+    def _ensure_scheduler(cls):
+        """
+        Start the shared scheduled-posts task if it isn't running
+
+        The lock, event and task are bound to the loop they were created on,
+        so they are rebuilt when called from a different event loop (as
+        get_session does for the HTTP session).
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            cls._scheduled_task is None
+            or cls._scheduled_task.done()
+            or cls._scheduled_loop is not loop
+        ):
+            cls._scheduled_lock = asyncio.Lock()
+            cls._wake = asyncio.Event()
+            cls._scheduled_task = asyncio.create_task(cls._process_scheduled_posts())
+            cls._scheduled_loop = loop
+
+    @classmethod
+    async def _process_scheduled_posts(cls):
+        """Background task to process scheduled posts for all instances"""
         while True:
             try:
-                now = datetime.utcnow()
-                
-                async with self._scheduled_lock:
+                async with cls._scheduled_lock:
+                    # Cleared under the lock so a concurrent push can't be missed
+                    cls._wake.clear()
+                    
                     # Process all posts that are due
-                    while self._scheduled_posts and self._scheduled_posts[0][0] <= now:
-                        scheduled_time, post_data = heappop(self._scheduled_posts)
-                        asyncio.create_task(self._post_impl(**post_data))
-                
-                # Sleep until the next scheduled post or 60 seconds
-                next_run = 60.0  # Default sleep time in seconds
-                if self._scheduled_posts:
-                    next_run = max(0, (self._scheduled_posts[0][0] - datetime.utcnow()).total_seconds())
+                    now = time.monotonic()
+                    while cls._scheduled_posts and cls._scheduled_posts[0][0] <= now:
+                        _, _, platform, post_data = heappop(cls._scheduled_posts)
+                        task = asyncio.create_task(platform._post_impl(**post_data))
+                        cls._post_tasks.add(task)
+                        task.add_done_callback(cls._on_post_done)
+                    
+                    delay = None
+                    if cls._scheduled_posts:
+                        delay = max(0.0, cls._scheduled_posts[0][0] - time.monotonic())
                 
-                await asyncio.sleep(min(1.0, next_run))  # Check at least every second
+                # Sleep until the next post is due or a new one is scheduled
+                if delay is None:
+                    await cls._wake.wait()
+                else:
+                    try:
+                        await asyncio.wait_for(cls._wake.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
                 
             except Exception as e:
-                self.logger.error(f"Error in scheduled posts processor: {str(e)}")
+                logger.error(f"Error in scheduled posts processor: {str(e)}")
                 await asyncio.sleep(5)  # Prevent tight loop on errors
 
+    @classmethod
+    def _on_post_done(cls, task: asyncio.Task) -> None:
+        """Drop a finished scheduled post's task and log its failure, if any"""
+        cls._post_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Scheduled Facebook post failed: {str(task.exception())}")
+
     async def post_batch(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Post multiple contents in a batch
@@ -185,45 +367,42 @@ class FacebookPlatform(Platform):
         for attempt in range(max_retries):
             try:
                 await self.rate_limiter.acquire()
-                session = await self.connection_pool.get_session()
                 
-                try:
-                    if content_type == "text":
-                        result = self.graph.put_object(
-                            parent_object='me',
-                            connection_name='feed',
-                            message=caption
-                        )
-                    elif content_type in ["image", "video"]:
-                        file_path = validate_file_path(content)
-                        media_id = await self._upload_media(file_path, content_type)
-                        
-                        result = self.graph.put_object(
-                            parent_object='me',
-                            connection_name='feed',
-                            message=caption,
-                            attached_media=[{"media_fbid": media_id}]
-                        )
-                    else:
-                        raise ValueError(f"Unsupported content type: {content_type}")
-                        
-                    return {
-                        "success": True,
-                        "post_id": result.get('id'),
-                        "caption": caption,
-                    }
-                        
-                finally:
-                    await self.connection_pool.release_session(session)
+                if content_type == "text":
+                    result = await asyncio.to_thread(
+                        self.graph.put_object,
+                        parent_object='me',
+                        connection_name='feed',
+                        message=caption
+                    )
+                elif content_type in MEDIA_TYPES:
+                    file_path = validate_file_path(content)
+                    media_id = await self._upload_media(file_path, content_type)
+                    
+                    result = await asyncio.to_thread(
+                        self.graph.put_object,
+                        parent_object='me',
+                        connection_name='feed',
+                        message=caption,
+                        attached_media=[{"media_fbid": media_id}]
+                    )
+                else:
+                    raise ValueError(f"Unsupported content type: {content_type}")
+                    
+                return {
+                    "success": True,
+                    "post_id": result.get('id'),
+                    "caption": caption,
+                }
                     
             except Exception as e:
                 if attempt == max_retries - 1:  # Last attempt
-                    self.logger.error(f"Facebook post failed after {max_retries} attempts: {str(e)}")
+                    logger.error(f"Facebook post failed after {max_retries} attempts: {str(e)}")
                     raise
                     
-                # Exponential backoff
-                delay = base_delay * (2 ** attempt)
-                self.logger.warning(f"Attempt {attempt + 1} failed, retrying in {delay:.1f}s: {str(e)}")
+                # Exponential backoff with full jitter, honouring Retry-After
+                delay = self._retry_delay(attempt, base_delay, e)
+                logger.warning(f"Attempt {attempt + 1} failed, retrying in {delay:.1f}s: {str(e)}")
                 await asyncio.sleep(delay)
 
     async def post(
@@ -240,7 +419,9 @@ class FacebookPlatform(Platform):
             content_type (str): Type of content (text, image, video)
             content (Any): Content to post
             caption (Optional[str]): Caption for the post
-            scheduled_time (Optional[datetime]): UTC time to schedule the post
+            scheduled_time (Optional[datetime]): UTC time to schedule the post.
+                Returns a confirmation immediately; the post is made by a
+                background task, so the event loop must still be running then
             
         Returns:
             Dict[str, Any]: Response from Facebook API or scheduling confirmation
@@ -259,16 +440,25 @@ class FacebookPlatform(Platform):
             if scheduled_time.tzinfo is not None:
                 scheduled_time = scheduled_time.astimezone(timezone.utc).replace(tzinfo=None)
                 
-            if scheduled_time < datetime.utcnow():
+            delay = (scheduled_time - datetime.utcnow()).total_seconds()
+            if delay < 0:
                 raise ValueError("Scheduled time must be in the future")
+            # Wall-clock time is only kept for display; the heap runs on the monotonic clock
+            deadline = time.monotonic() + delay
                 
-            async with self._scheduled_lock:
-                heappush(self._scheduled_posts, (scheduled_time, post_data))
+            cls = FacebookPlatform
+            cls._ensure_scheduler()
+            async with cls._scheduled_lock:
+                heappush(
+                    cls._scheduled_posts,
+                    (deadline, next(cls._scheduled_seq), self, post_data),
+                )
+                cls._wake.set()
                 
             return {
                 "success": True,
                 "scheduled": True,
-                "scheduled_time": scheduled_time.isoformat(),
+                "scheduled_time": format_datetime(scheduled_time),
                 "message": "Post scheduled successfully"
             }
             
@@ -276,16 +466,33 @@ class FacebookPlatform(Platform):
 
     async def close(self):
         """Clean up resources"""
-        if hasattr(self, '_scheduled_task'):
-            self._scheduled_task.cancel()
-            try:
-                await self._scheduled_task
-            except asyncio.CancelledError:
-                pass
+        cls = FacebookPlatform
+        cls._instances.discard(self)
+        
+        # Drop this instance's pending posts; stop the scheduler with the last
+        # instance. State left on another (likely closed) loop is only dropped,
+        # since its lock and task can't be awaited from this one.
+        on_loop = cls._scheduled_loop is asyncio.get_running_loop()
+        if on_loop:
+            await cls._scheduled_lock.acquire()
+        try:
+            cls._scheduled_posts[:] = [
+                item for item in cls._scheduled_posts if item[2] is not self
+            ]
+            heapify(cls._scheduled_posts)
+        finally:
+            if on_loop:
+                cls._scheduled_lock.release()
+        
+        task = cls._scheduled_task
+        if task is not None and not cls._instances:
+            cls._scheduled_task = None
+            cls._scheduled_loop = None
+            if on_loop:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
                 
-        if hasattr(self, 'connection_pool'):
-            # Close all sessions in the connection pool
-            while self.connection_pool._pool:
-                session = self.connection_pool._pool.popleft()
-                await session.close()
         self.graph = None
@@ -1,14 +1,97 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
+from collections import OrderedDict
+import asyncio
 import logging
 import json
+import os
+import struct
+import threading
 from time import sleep
 import aiohttp
 from PIL import Image
 from .base import Platform
+from ..utils import validate_file_path
 from instagrapi import Client
 
+logger = logging.getLogger("pluseposter.instagram")
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# JPEG start-of-frame markers carrying the image dimensions (C4, C8, CC are not frames)
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+IMAGE_PROBE_CACHE_SIZE = 128
+
+# (path, mtime, size) -> (width, height, format) or None if unreadable
+_image_probe_cache: "OrderedDict[Tuple[str, float, int], Optional[Tuple[int, int, str]]]" = OrderedDict()
+_image_probe_lock = threading.Lock()  # probes run in worker threads
+
+
+def _read_jpeg_size(f) -> Optional[Tuple[int, int]]:
+    """Walk JPEG segments up to the first SOF marker and return (width, height)"""
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        while byte == b"\xff":
+            byte = f.read(1)
+        if not byte:
+            return None
+        marker = byte[0]
+        if marker == 0xD8 or 0xD0 <= marker <= 0xD7:
+            continue  # standalone markers have no length field
+        header = f.read(2)
+        if len(header) < 2:
+            return None
+        (length,) = struct.unpack(">H", header)
+        if marker in JPEG_SOF_MARKERS:
+            data = f.read(5)
+            if len(data) < 5:
+                return None
+            height, width = struct.unpack(">xHH", data)
+            return width, height
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _probe_image(file_path: str) -> Optional[Tuple[int, int, str]]:
+    """
+    Read an image's dimensions and format without decoding it
+
+    JPEG and PNG headers are parsed directly; anything else falls back to
+    PIL. Blocking, so call it from a worker thread.
+
+    Returns:
+        Optional[Tuple[int, int, str]]: (width, height, format), or None if unreadable
+    """
+    st = os.stat(file_path)
+    key = (str(file_path), st.st_mtime, st.st_size)
+    with _image_probe_lock:
+        if key in _image_probe_cache:
+            _image_probe_cache.move_to_end(key)
+            return _image_probe_cache[key]
+
+    result = None
+    try:
+        with open(file_path, "rb") as f:
+            head = f.read(24)
+            if head[:8] == PNG_SIGNATURE and head[12:16] == b"IHDR":
+                width, height = struct.unpack(">II", head[16:24])
+                result = (width, height, "PNG")
+            elif head[:2] == b"\xff\xd8":
+                size = _read_jpeg_size(f)
+                if size:
+                    result = (size[0], size[1], "JPEG")
+        if result is None:
+            with Image.open(file_path) as img:
+                result = (img.size[0], img.size[1], img.format)
+    except Exception:
+        result = None
+
+    with _image_probe_lock:
+        _image_probe_cache[key] = result
+        if len(_image_probe_cache) > IMAGE_PROBE_CACHE_SIZE:
+            _image_probe_cache.popitem(last=False)
+    return result
+
 
 class InstagramPlatform(Platform):
     """
@@ -16,7 +99,6 @@ class InstagramPlatform(Platform):
     """
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        self.logger = logging.getLogger("pluseposter.instagram")
         self.client = None
         self._ensure_client()
 
@@ -30,7 +112,7 @@ class InstagramPlatform(Platform):
                     self.config.api_secret,  # password
                 )
             except Exception as e:
-                self.logger.error(f"Instagram login failed: {str(e)}")
+                logger.error(f"Instagram login failed: {str(e)}")
                 raise
 
     async def _validate_image(self, file_path: str) -> bool:
@@ -44,18 +126,20 @@ class InstagramPlatform(Platform):
             bool: True if image is valid
         """
         try:
-            with Image.open(file_path) as img:
-                width, height = img.size
-                # Instagram requirements
-                if width < 320 or height < 320:
-                    return False
-                if width > 1080 or height > 1080:
-                    return False
-                if img.format not in ['JPEG', 'PNG']:
-                    return False
-            return True
-        except Exception:
+            probe = await asyncio.to_thread(_probe_image, file_path)
+        except OSError:
+            return False
+        if probe is None:
+            return False
+        width, height, image_format = probe
+        # Instagram requirements
+        if width < 320 or height < 320:
+            return False
+        if width > 1080 or height > 1080:
+            return False
+        if image_format not in ['JPEG', 'PNG']:
             return False
+        return True
 
     async def _validate_video(self, file_path: str) -> bool:
         """
@@ -87,7 +171,8 @@ class InstagramPlatform(Platform):
             content_type (str): Type of content (image, video)
             content (Any): Content to post
             caption (Optional[str]): Caption for the post
-            scheduled_time (Optional[datetime]): Time to schedule the post
+            scheduled_time (Optional[datetime]): UTC time to schedule the post.
+                The call blocks until then and returns once the post is made
             
         Returns:
             Dict[str, Any]: Response from Instagram API
@@ -130,7 +215,7 @@ class InstagramPlatform(Platform):
             }
 
         except Exception as e:
-            self.logger.error(f"Instagram post failed: {str(e)}")
+            logger.error(f"Instagram post failed: {str(e)}")
             raise
 
     async def close(self):
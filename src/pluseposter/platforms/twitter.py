@@ -1,10 +1,148 @@
 from typing import Dict, Any, Optional
 from datetime import datetime
+import aiofiles
 import aiohttp
+import asyncio
+import itertools
 import logging
-from .base import Platform
+import mimetypes
+import orjson
+import os
+import random
+import time
+import unicodedata
+from functools import lru_cache
+from urllib.parse import urlsplit
+from .base import MEDIA_TYPES, Platform
+from ..session import get_session
 from ..utils import validate_file_path
 
+logger = logging.getLogger("pluseposter.twitter")
+
+CHUNK_SIZE = 4 * 1024 * 1024  # 4MB APPEND segments
+APPEND_CONCURRENCY = 4  # APPEND requests in flight, and chunk buffers allocated
+MAX_RETRIES = 4
+SIMPLE_UPLOAD_MAX_BYTES = 5 * 1024 * 1024  # images up to this size need no chunking
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Tweet length as counted by twitter-text: code points in these ranges weigh 1,
+# everything else (CJK, emoji, ...) weighs 2, up to a total of 280
+TWEET_MAX_WEIGHT = 280
+_LIGHT_RANGES = ((0, 4351), (8192, 8205), (8208, 8223), (8242, 8247))
+
+# Reusable chunk buffers, created on first upload for the running loop.
+# Taking a buffer is also what bounds APPEND concurrency. Segments are sent as
+# memoryview slices of these buffers, which aiohttp writes without copying.
+# An mmap of the file would avoid the read copy too, but its page faults would
+# block the event loop mid-write; reads here stay in aiofiles' worker thread.
+_chunk_pool: Optional["asyncio.Queue[bytearray]"] = None
+_chunk_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_chunk_pool() -> "asyncio.Queue[bytearray]":
+    """Get the chunk buffer pool for the running event loop"""
+    global _chunk_pool, _chunk_pool_loop
+    loop = asyncio.get_running_loop()
+    if _chunk_pool is None or _chunk_pool_loop is not loop:
+        _chunk_pool = asyncio.Queue()
+        for _ in range(APPEND_CONCURRENCY):
+            _chunk_pool.put_nowait(bytearray(CHUNK_SIZE))
+        _chunk_pool_loop = loop
+    return _chunk_pool
+
+
+def _rate_limit_delay(headers) -> Optional[float]:
+    """
+    Seconds the server asked us to wait, padded with up to 10% jitter
+
+    Reads Retry-After, then x-rate-limit-reset (epoch seconds). Returns None
+    if neither header is usable.
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return float(retry_after) * (1 + random.random() * 0.1)
+        except ValueError:
+            pass  # HTTP-date form
+    reset = headers.get("x-rate-limit-reset")
+    if reset is not None:
+        try:
+            return max(0.0, float(reset) - time.time()) * (1 + random.random() * 0.1)
+        except ValueError:
+            pass
+    return None
+
+
+def _char_weight(ch: str) -> int:
+    """Weight of one code point in Twitter's length count"""
+    cp = ord(ch)
+    for low, high in _LIGHT_RANGES:
+        if low <= cp <= high:
+            return 1
+    return 2
+
+
+def _extends_previous(ch: str) -> bool:
+    """True for code points that belong to the preceding character's grapheme"""
+    cp = ord(ch)
+    return (
+        unicodedata.combining(ch) != 0
+        or cp == 0x200D  # zero-width joiner
+        or 0xFE00 <= cp <= 0xFE0F  # variation selectors
+        or 0x1F3FB <= cp <= 0x1F3FF  # emoji skin tone modifiers
+        or cp == 0x20E3  # combining enclosing keycap (combining class 0)
+        or 0xE0020 <= cp <= 0xE007F  # tag characters in subdivision flags
+    )
+
+
+def _is_regional_indicator(ch: str) -> bool:
+    """True for the letters that pair up into country flag emoji"""
+    return 0x1F1E6 <= ord(ch) <= 0x1F1FF
+
+
+def _splits_flag(text: str, i: int) -> bool:
+    """True if cutting before text[i] separates the two halves of a flag"""
+    if not _is_regional_indicator(text[i]):
+        return False
+    run = 0
+    while i - run > 0 and _is_regional_indicator(text[i - run - 1]):
+        run += 1
+    return run % 2 == 1  # text[i] is the second letter of a pair
+
+
+@lru_cache(maxsize=256)
+def _truncate_tweet(text: str) -> str:
+    """
+    Truncate text to Twitter's weighted length limit
+
+    Never cuts a character apart from its combining marks, modifiers or
+    joined emoji sequence. Cached, since the same caption is often posted
+    repeatedly.
+    """
+    if len(text) * 2 <= TWEET_MAX_WEIGHT:
+        return text  # fits even if every character weighs 2
+    weight = 0
+    for i, ch in enumerate(text):
+        weight += _char_weight(ch)
+        if weight > TWEET_MAX_WEIGHT:
+            while i > 0 and (
+                _extends_previous(text[i])
+                or text[i - 1] == "\u200d"
+                or _splits_flag(text, i)
+            ):
+                i -= 1
+            return text[:i]
+    return text
+
+
+def _media_category(media_type: str) -> str:
+    """Map a MIME type to Twitter's media_category for chunked uploads"""
+    if media_type == "image/gif":
+        return "tweet_gif"
+    if media_type.startswith("video/"):
+        return "tweet_video"
+    return "tweet_image"
+
 
 class TwitterPlatform(Platform):
     """
@@ -15,66 +153,195 @@ class TwitterPlatform(Platform):
 
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        self.logger = logging.getLogger("pluseposter.twitter")
-        self.session = None
+        # host -> monotonic time before which no request may be sent to it;
+        # shared by concurrent requests (e.g. parallel APPENDs) so they all
+        # back off together when the host throttles us
+        self._next_allowed: Dict[str, float] = {}
+        # Built once; sent per request since the session is shared
+        self._auth = aiohttp.BasicAuth(
+            self.config.api_key,
+            self.config.api_secret
+        )
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create a new aiohttp session"""
-        if not self.session:
-            auth = aiohttp.BasicAuth(
-                self.config.api_key,
-                self.config.api_secret
-            )
-            self.session = aiohttp.ClientSession(auth=auth)
-        return self.session
+        """Get the shared aiohttp session"""
+        return await get_session()
+
+    async def _request(self, method: str, url: str, **kwargs) -> Any:
+        """
+        Send an authenticated request, retrying throttled and transient failures
+        
+        429 and 5xx responses, dropped connections and timeouts are retried
+        up to MAX_RETRIES times with full-jitter backoff, or waiting as long
+        as the rate-limit headers ask. When a host reports its rate limit
+        is exhausted, later requests to it wait until the window resets.
+        
+        Args:
+            method (str): HTTP method
+            url (str): Request URL
+            **kwargs: Passed through to ``session.request``. ``data`` may be
+                a zero-argument callable, called for a fresh request body on
+                every attempt (for bodies like FormData that can't be resent)
+            
+        Returns:
+            Any: Parsed JSON body, or None for empty responses
+        """
+        session = await self._get_session()
+        host = urlsplit(url).hostname
+        body = kwargs.pop("data", None)
+        
+        for attempt in range(MAX_RETRIES):
+            wait = self._next_allowed.get(host, 0.0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            
+            data = body() if callable(body) else body
+            try:
+                async with session.request(method, url, auth=self._auth, data=data, **kwargs) as resp:
+                    if resp.headers.get("x-rate-limit-remaining") == "0":
+                        reset_delay = _rate_limit_delay(resp.headers)
+                        if reset_delay is not None:
+                            self._hold(host, reset_delay)
+                    
+                    if resp.status < 300:
+                        if resp.status == 204 or resp.content_length == 0:
+                            return None
+                        return orjson.loads(await resp.read())
+                    
+                    if resp.status not in RETRY_STATUSES or attempt == MAX_RETRIES - 1:
+                        error = await resp.text()
+                        raise Exception(f"Twitter API error ({resp.status}): {error}")
+                    
+                    delay = _rate_limit_delay(resp.headers)
+                    if delay is None:
+                        delay = random.uniform(0, 2 ** attempt)  # full-jitter backoff
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                # Dropped connections and timeouts are retried like 5xx responses
+                if attempt == MAX_RETRIES - 1:
+                    raise
+                delay = random.uniform(0, 2 ** attempt)
+                logger.warning(f"Twitter request failed ({e!r}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            
+            logger.warning(f"Twitter returned {resp.status}, retrying in {delay:.1f}s")
+            self._hold(host, delay)
+
+    def _hold(self, host: str, delay: float) -> None:
+        """Block requests to `host` for the next `delay` seconds"""
+        until = time.monotonic() + delay
+        if until > self._next_allowed.get(host, 0.0):
+            self._next_allowed[host] = until
+
+    async def _append_chunk(self, media_id: str, segment_index: int, chunk: memoryview) -> None:
+        """Upload one APPEND segment"""
+        await self._request(
+            "POST",
+            self.MEDIA_UPLOAD_URL,
+            params={
+                "command": "APPEND",
+                "media_id": media_id,
+                "segment_index": segment_index,
+            },
+            data=chunk,
+        )
+
+    async def _simple_upload(self, file_path: str, media_type: str) -> str:
+        """Upload a small image in a single multipart request"""
+        async with aiofiles.open(file_path, "rb") as f:
+            media = await f.read()
+        filename = os.path.basename(file_path)
+        
+        def form() -> aiohttp.FormData:
+            data = aiohttp.FormData()
+            data.add_field("media", media, filename=filename, content_type=media_type)
+            return data
+        
+        upload_data = await self._request("POST", self.MEDIA_UPLOAD_URL, data=form)
+        return upload_data["media_id_string"]
 
     async def _upload_media(self, file_path: str) -> str:
         """
         Upload media to Twitter
         
+        Images up to SIMPLE_UPLOAD_MAX_BYTES go up in one request; anything
+        larger, and all videos, use the chunked INIT/APPEND/FINALIZE flow.
+        
         Args:
             file_path (str): Path to the media file
             
         Returns:
             str: Media ID from Twitter
         """
-        session = await self._get_session()
+        file_path = validate_file_path(file_path)
+        media_type = mimetypes.guess_type(str(file_path))[0] or "application/octet-stream"
+        media_category = _media_category(media_type)
+        total_bytes = (await asyncio.to_thread(os.stat, file_path)).st_size
+        if media_category != "tweet_video" and total_bytes <= SIMPLE_UPLOAD_MAX_BYTES:
+            return await self._simple_upload(file_path, media_type)
         
         # Step 1: Initialize upload
-        async with session.post(
+        init_data = await self._request(
+            "POST",
             self.MEDIA_UPLOAD_URL,
-            params={"command": "INIT", "media_type": "image/jpeg"},
-        ) as resp:
-            init_data = await resp.json()
-            media_id = init_data["media_id_string"]
+            params={
+                "command": "INIT",
+                "media_type": media_type,
+                "total_bytes": total_bytes,
+                "media_category": media_category,
+            },
+        )
+        media_id = init_data["media_id_string"]
 
-        # Step 2: Upload chunks
-        file_path = validate_file_path(file_path)
-        with open(file_path, "rb") as f:
-            chunk = f.read(4 * 1024 * 1024)  # 4MB chunks
-            while chunk:
-                async with session.post(
-                    self.MEDIA_UPLOAD_URL,
-                    params={
-                        "command": "APPEND",
-                        "media_id": media_id,
-                        "segment_index": 0,
-                    },
-                    data=chunk,
-                ) as resp:
-                    if resp.status != 204:
-                        raise Exception("Failed to upload media chunk")
-                chunk = f.read(4 * 1024 * 1024)
+        # Step 2: Upload chunks, several at a time (Twitter orders them by segment_index)
+        pool = _get_chunk_pool()
+        tasks = []
+        failed = False  # set as soon as any APPEND fails, to stop reading
+
+        def on_append_done(task: asyncio.Task, buf: bytearray) -> None:
+            nonlocal failed
+            if not task.cancelled() and task.exception() is not None:
+                failed = True
+            # Return the buffer however the task ends, even if cancelled before it starts
+            pool.put_nowait(buf)
+
+        try:
+            async with aiofiles.open(file_path, "rb") as f:
+                for segment_index in itertools.count():
+                    if failed:
+                        break
+                    buf = await pool.get()
+                    if failed:
+                        pool.put_nowait(buf)
+                        break
+                    try:
+                        size = await f.readinto(buf)
+                    except BaseException:
+                        pool.put_nowait(buf)
+                        raise
+                    if not size:
+                        pool.put_nowait(buf)
+                        break
+                    task = asyncio.create_task(
+                        self._append_chunk(media_id, segment_index, memoryview(buf)[:size])
+                    )
+                    task.add_done_callback(lambda t, buf=buf: on_append_done(t, buf))
+                    tasks.append(task)
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
 
         # Step 3: Finalize upload
-        async with session.post(
+        finalize_data = await self._request(
+            "POST",
             self.MEDIA_UPLOAD_URL,
             params={"command": "FINALIZE", "media_id": media_id},
-        ) as resp:
-            finalize_data = await resp.json()
-            if finalize_data.get("processing_info"):
-                # TODO: Handle processing
-                pass
+        )
+        if finalize_data.get("processing_info"):
+            # TODO: Handle processing
+            pass
 
         return media_id
 
@@ -92,7 +359,8 @@ class TwitterPlatform(Platform):
             content_type (str): Type of content (text, image, video)
             content (Any): Content to post
             caption (Optional[str]): Caption for the post
-            scheduled_time (Optional[datetime]): Time to schedule the post
+            scheduled_time (Optional[datetime]): UTC time to schedule the post.
+                The call blocks until then and returns once the post is made
             
         Returns:
             Dict[str, Any]: Response from Twitter API
@@ -100,8 +368,6 @@ class TwitterPlatform(Platform):
         if not self._validate_content(content_type, content):
             raise ValueError("Invalid content")
 
-        session = await self._get_session()
-        
         # Handle different content types
         if content_type == "text":
             text = content if isinstance(content, str) else caption
@@ -109,40 +375,31 @@ class TwitterPlatform(Platform):
                 raise ValueError("Text content is required")
             
             payload = {
-                "text": text[:280],  # Twitter's character limit
+                "text": _truncate_tweet(text),
             }
 
-        elif content_type in ["image", "video"]:
+        elif content_type in MEDIA_TYPES:
             if not isinstance(content, str):
                 raise ValueError("File path is required for media content")
-            
+
+        else:
+            raise ValueError(f"Unsupported content type: {content_type}")
+
+        # Handle scheduling before uploading, so media isn't uploaded hours
+        # ahead of the tweet that uses it
+        await self._handle_scheduling(scheduled_time)
+
+        if content_type in MEDIA_TYPES:
             media_id = await self._upload_media(content)
             payload = {
-                "text": caption[:280] if caption else "",
+                "text": _truncate_tweet(caption) if caption else "",
                 "media": {
                     "media_ids": [media_id],
                 },
             }
 
-        else:
-            raise ValueError(f"Unsupported content type: {content_type}")
-
-        # Handle scheduling
-        await self._handle_scheduling(scheduled_time)
-
         # Make the API request
-        async with session.post(
-            f"{self.API_URL}/tweets",
-            json=payload,
-        ) as resp:
-            if resp.status != 201:
-                error = await resp.json()
-                raise Exception(f"Twitter API error: {error}")
-            
-            return await resp.json()
+        return await self._request("POST", f"{self.API_URL}/tweets", json=payload)
 
     async def close(self):
-        """Close the aiohttp session"""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        """Release platform resources (the shared session is closed by its owner)"""
@@ -1,9 +1,12 @@
 from typing import Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
+import asyncio
+import importlib
 import logging
 from .config import Config
 from .utils import logger
+from .platforms import PLATFORM_CLASSES
 from .platforms.base import Platform
 
 
@@ -53,17 +56,12 @@ class PlusePoster:
         
         Each platform is initialized with its own configuration.
         """
-        from .platforms.twitter import TwitterPlatform
-        from .platforms.instagram import InstagramPlatform
-        from .platforms.facebook import FacebookPlatform
-        
-        # Initialize platforms if configured
-        if self.config.twitter:
-            self.platforms["twitter"] = TwitterPlatform(self.config.twitter)
-        if self.config.instagram:
-            self.platforms["instagram"] = InstagramPlatform(self.config.instagram)
-        if self.config.facebook:
-            self.platforms["facebook"] = FacebookPlatform(self.config.facebook)
+        # Only configured platforms have their modules imported
+        for name, class_name in PLATFORM_CLASSES.items():
+            platform_config = getattr(self.config, name)
+            if platform_config:
+                module = importlib.import_module(f".platforms.{name}", package=__package__)
+                self.platforms[name] = getattr(module, class_name)(platform_config)
 
     async def post(
         self,
@@ -85,7 +83,11 @@ class PlusePoster:
             caption (Optional[str]): Caption for media posts
             scheduled_time (Optional[datetime]): Time to schedule the post
                 - If None, posts immediately
-                - Format: YYYY-MM-DDTHH:MM:SS
+                - Naive times are UTC
+                - Twitter and Instagram: the call waits until this time,
+                  then posts
+                - Facebook: returns a confirmation at once and posts from
+                  a background task while the event loop keeps running
                 
         Returns:
             Dict[str, Any]: Response from the platform
@@ -108,10 +110,10 @@ class PlusePoster:
         )
         ```
         """
-        if platform not in self.platforms:
+        platform_instance = self.platforms.get(platform)
+        if platform_instance is None:
             raise ValueError(f"Platform '{platform}' is not supported")
 
-        platform_instance = self.platforms[platform]
         return await platform_instance.post(
             content_type=content_type,
             content=content,
@@ -125,13 +127,16 @@ class PlusePoster:
         content_type: str,
         content: Any,
         caption: Optional[str] = None,
+        *,
         scheduled_time: datetime,
     ) -> Dict[str, Any]:
         """
         📅 Schedule a post for a future time
         
         This method is a convenience wrapper around the post() method
-        that automatically sets the scheduled_time parameter.
+        that automatically sets the scheduled_time parameter. On Twitter
+        and Instagram it doesn't return until the post is made; Facebook
+        queues the post and returns immediately.
         
         Args:
             platform (str): Platform name
@@ -139,7 +144,7 @@ class PlusePoster:
             content (Any): Content to post
             caption (Optional[str]): Caption for the post
             scheduled_time (datetime): Time to schedule the post
-                - Must be in the future
+                - Must be in the future; naive times are UTC
                 - Format: YYYY-MM-DDTHH:MM:SS
                 
         Returns:
@@ -170,7 +175,9 @@ class PlusePoster:
         🔒 Clean up all platform connections
         
         This method should be called when you're done using PlusePoster.
-        It ensures all platform sessions are properly closed.
+        It closes every platform concurrently and then the HTTP session
+        they share. A platform that fails to close is logged and doesn't
+        stop the others from closing.
         
         Example:
         ```python
@@ -178,96 +185,14 @@ class PlusePoster:
         await poster.close()
         ```
         """
-        for platform in self.platforms.values():
-            await platform.close()
-
-    def _initialize_platforms(self):
-        """Initialize all supported platforms"""
-        from .platforms.twitter import TwitterPlatform
-        from .platforms.instagram import InstagramPlatform
-        from .platforms.facebook import FacebookPlatform
-        
-        # Initialize platforms if configured
-        if self.config.twitter:
-            self.platforms["twitter"] = TwitterPlatform(self.config.twitter)
-        if self.config.instagram:
-            self.platforms["instagram"] = InstagramPlatform(self.config.instagram)
-        if self.config.facebook:
-            self.platforms["facebook"] = FacebookPlatform(self.config.facebook)
-
-    async def post(
-        self,
-        platform: str,
-        content_type: str,
-        content: Any,
-        caption: Optional[str] = None,
-        scheduled_time: Optional[datetime] = None,
-    ) -> Dict[str, Any]:
-        """
-        Post content to a specific platform
-        
-        Args:
-            platform (str): Platform name (twitter, instagram, etc.)
-            content_type (str): Type of content (text, image, video)
-            content (Any): Content to post
-            caption (Optional[str]): Caption for the post
-            scheduled_time (Optional[datetime]): Time to schedule the post
-            
-        Returns:
-            Dict[str, Any]: Response from the platform
-        """
-        if platform not in self.platforms:
-            raise ValueError(f"Platform '{platform}' is not supported")
-
-        platform_instance = self.platforms[platform]
-        return await platform_instance.post(
-            content_type=content_type,
-            content=content,
-            caption=caption,
-            scheduled_time=scheduled_time,
-        )
-
-    async def schedule_post(
-        self,
-        platform: str,
-        content_type: str,
-        content: Any,
-        caption: Optional[str] = None,
-        scheduled_time: datetime,
-    ) -> Dict[str, Any]:
-        """
-        Schedule a post for a future time
+        from .session import close_session
         
-        Args:
-            platform (str): Platform name
-            content_type (str): Type of content
-            content (Any): Content to post
-            caption (Optional[str]): Caption for the post
-            scheduled_time (datetime): Time to schedule the post
-            
-        Returns:
-            Dict[str, Any]: Scheduling response
-        """
-        return await self.post(
-            platform=platform,
-            content_type=content_type,
-            content=content,
-            caption=caption,
-            scheduled_time=scheduled_time,
+        names = list(self.platforms)
+        results = await asyncio.gather(
+            *(platform.close() for platform in self.platforms.values()),
+            return_exceptions=True,
         )
-
-    async def close(self):
-        """
-        🔒 Clean up all platform connections
-        
-        This method should be called when you're done using PlusePoster.
-        It ensures all platform sessions are properly closed.
-        
-        Example:
-        ```python
-        # Close all connections
-        await poster.close()
-        ```
-        """
-        for platform in self.platforms.values():
-            await platform.close()
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error closing {name}: {str(result)}")
+        await close_session()
@@ -0,0 +1,61 @@
+import asyncio
+from typing import Any, Optional
+import aiohttp
+import orjson
+from aiohttp.abc import AbstractResolver
+
+# One aiohttp session shared by every HTTP-based platform, so TCP and TLS
+# connections are reused across uploads, posts and platforms. Credentials are
+# passed per request, never set on the session.
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _json_dumps(obj: Any) -> str:
+    """orjson-backed serializer for json= request bodies (aiohttp wants str)"""
+    return orjson.dumps(obj).decode()
+
+
+def _make_resolver() -> AbstractResolver:
+    """Use the non-blocking c-ares resolver when aiodns is installed"""
+    try:
+        return aiohttp.AsyncResolver()
+    except RuntimeError:  # aiodns not installed
+        return aiohttp.ThreadedResolver()
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Get or lazily create the shared aiohttp session
+
+    A new session is created if none exists, the previous one was closed,
+    or it belongs to a different event loop.
+
+    Returns:
+        aiohttp.ClientSession: The shared session
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=1024,
+                limit_per_host=64,
+                use_dns_cache=True,
+                ttl_dns_cache=300,
+                resolver=_make_resolver(),
+                enable_cleanup_closed=True,
+            ),
+            json_serialize=_json_dumps,
+        )
+        _session_loop = loop
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared aiohttp session, if one is open"""
+    global _session, _session_loop
+    if _session is not None:
+        await _session.close()
+    _session = None
+    _session_loop = None
@@ -1,16 +1,31 @@
+import atexit
 import logging
+import os
+import queue
+import stat
+from datetime import datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 import sys
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
+# Configure logging. Records are formatted by the QueueHandler and written to
+# stdout and the log file by a background listener thread, so logging from
+# async code never blocks the event loop on disk I/O.
+if not logging.getLogger().handlers:
+    _log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(
+        _log_queue,
         logging.StreamHandler(sys.stdout),
         logging.FileHandler("pluseposter.log"),
-    ],
-)
+    )
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[QueueHandler(_log_queue)],
+    )
 
 logger = logging.getLogger("pluseposter")
 
@@ -28,10 +43,14 @@ def setup_logging(debug: bool = False) -> None:
         handler.setLevel(level)
 
 
+@lru_cache(maxsize=256)
 def validate_file_path(file_path: str) -> Path:
     """
     Validate and return a file path
     
+    Uses a single stat call; successful results are cached, since the same
+    asset is often posted to several platforms. Failures are not cached.
+    
     Args:
         file_path (str): Path to validate
         
@@ -41,18 +60,24 @@ def validate_file_path(file_path: str) -> Path:
     Raises:
         ValueError: If file does not exist or is not accessible
     """
-    path = Path(file_path)
-    if not path.exists():
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
         raise ValueError(f"File does not exist: {file_path}")
-    if not path.is_file():
+    except OSError as e:
+        raise ValueError(f"File is not accessible: {file_path} ({e})")
+    if not stat.S_ISREG(st.st_mode):
         raise ValueError(f"Not a file: {file_path}")
-    return path
+    return Path(file_path)
 
 
+@lru_cache(maxsize=128)
 def format_datetime(dt: datetime) -> str:
     """
     Format datetime in ISO format
     
+    Cached, since the same scheduled time is usually sent to every platform.
+    
     Args:
         dt (datetime): Datetime to format
         
@@ -0,0 +1,64 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from pluseposter.platforms import base
+from pluseposter.platforms.base import Platform
+from pluseposter.utils import validate_file_path
+
+
+class DummyPlatform(Platform):
+    async def post(self, content_type, content, caption=None, scheduled_time=None):
+        return {}
+
+
+def test_validate_content_accepts_text_and_existing_media(tmp_path):
+    image = tmp_path / "photo.jpg"
+    image.write_bytes(b"a")
+    platform = DummyPlatform({})
+    assert platform._validate_content("text", "hello")
+    assert platform._validate_content("image", str(image))
+    assert platform._validate_content("video", image)
+
+
+def test_validate_content_rejects_missing_files_and_non_paths(tmp_path):
+    platform = DummyPlatform({})
+    assert not platform._validate_content("image", str(tmp_path / "missing.jpg"))
+    assert not platform._validate_content("image", str(tmp_path))
+    assert not platform._validate_content("video", 42)
+
+
+def test_validate_content_primes_validate_file_path_cache(tmp_path):
+    image = tmp_path / "photo.jpg"
+    image.write_bytes(b"a")
+    DummyPlatform({})._validate_content("image", str(image))
+    hits = validate_file_path.cache_info().hits
+    validate_file_path(str(image))
+    assert validate_file_path.cache_info().hits == hits + 1
+
+
+def run_scheduling(monkeypatch, scheduled_time):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(base.asyncio, "sleep", fake_sleep)
+    asyncio.run(DummyPlatform({})._handle_scheduling(scheduled_time))
+    return delays
+
+
+def test_handle_scheduling_waits_until_scheduled_time(monkeypatch):
+    scheduled = datetime.now(timezone.utc) + timedelta(hours=1)
+    (delay,) = run_scheduling(monkeypatch, scheduled)
+    assert 3590 < delay <= 3600
+
+
+def test_handle_scheduling_treats_naive_times_as_utc(monkeypatch):
+    scheduled = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(minutes=10)
+    (delay,) = run_scheduling(monkeypatch, scheduled)
+    assert 590 < delay <= 600
+
+
+def test_handle_scheduling_does_not_wait_for_past_or_missing_times(monkeypatch):
+    assert run_scheduling(monkeypatch, None) == []
+    assert run_scheduling(monkeypatch, datetime.now(timezone.utc) - timedelta(seconds=5)) == []
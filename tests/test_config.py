@@ -0,0 +1,121 @@
+import os
+
+import pytest
+
+from pluseposter import config as config_module
+from pluseposter.config import Config
+
+
+@pytest.fixture(autouse=True)
+def clean_caches(monkeypatch):
+    for name in config_module._ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    config_module._YAML_CACHE.clear()
+    Config.invalidate_env_cache()
+    yield
+    config_module._YAML_CACHE.clear()
+    Config.invalidate_env_cache()
+
+
+@pytest.fixture
+def no_dotenv(monkeypatch):
+    monkeypatch.setattr(config_module, "find_dotenv", lambda: "")
+
+
+def test_from_env_is_cached_while_environment_is_unchanged(no_dotenv, monkeypatch):
+    monkeypatch.setenv("TWITTER_API_KEY", "key")
+    monkeypatch.setenv("TWITTER_API_SECRET", "secret")
+    first = Config.from_env()
+    assert first.twitter.api_key == "key"
+    assert Config.from_env() is first
+
+
+def test_from_env_picks_up_changed_environment_without_dotenv(no_dotenv, monkeypatch):
+    monkeypatch.setenv("TWITTER_API_KEY", "first")
+    monkeypatch.setenv("TWITTER_API_SECRET", "secret")
+    assert Config.from_env().twitter.api_key == "first"
+    monkeypatch.setenv("TWITTER_API_KEY", "second")
+    assert Config.from_env().twitter.api_key == "second"
+    monkeypatch.setenv("FACEBOOK_API_KEY", "fb")
+    monkeypatch.setenv("FACEBOOK_API_SECRET", "fb-secret")
+    assert Config.from_env().facebook.api_key == "fb"
+
+
+def test_from_env_reloads_when_dotenv_changes(tmp_path, monkeypatch):
+    dotenv = tmp_path / ".env"
+    dotenv.write_text("TWITTER_API_KEY=first\nTWITTER_API_SECRET=secret\n")
+    monkeypatch.setattr(config_module, "find_dotenv", lambda: str(dotenv))
+    assert Config.from_env().twitter.api_key == "first"
+
+    dotenv.write_text("TWITTER_API_KEY=second\nTWITTER_API_SECRET=secret\n")
+    os.utime(dotenv, (0, os.stat(dotenv).st_mtime + 10))
+    assert Config.from_env().twitter.api_key == "second"
+
+
+def test_invalidate_env_cache_forces_rebuild(no_dotenv, monkeypatch):
+    monkeypatch.setenv("INSTAGRAM_API_KEY", "ig")
+    monkeypatch.setenv("INSTAGRAM_API_SECRET", "ig-secret")
+    first = Config.from_env()
+    Config.invalidate_env_cache()
+    second = Config.from_env()
+    assert second is not first
+    assert second == first
+
+
+def write_yaml(path, api_key):
+    path.write_text(f"twitter:\n  api_key: {api_key}\n  api_secret: secret\n")
+
+
+def test_from_yaml_cache_hit_and_file_change(tmp_path):
+    path = tmp_path / "config.yaml"
+    write_yaml(path, "first")
+    first = Config.from_yaml(path)
+    assert Config.from_yaml(path) is first
+
+    write_yaml(path, "second!")  # different size, so the cache misses
+    assert Config.from_yaml(path).twitter.api_key == "second!"
+
+
+def test_from_yaml_follows_referenced_env_vars(tmp_path, monkeypatch):
+    path = tmp_path / "config.yaml"
+    write_yaml(path, '"${TW_KEY}"')
+    monkeypatch.setenv("TW_KEY", "first")
+    first = Config.from_yaml(path)
+    assert first.twitter.api_key == "first"
+    assert Config.from_yaml(path) is first
+
+    monkeypatch.setenv("TW_KEY", "second")
+    assert Config.from_yaml(path).twitter.api_key == "second"
+
+
+@pytest.mark.parametrize("value", ["a: b", "x # y", "*ref", "&anchor", "!tag", "{[", "${OTHER}"])
+def test_from_yaml_env_values_are_not_parsed_as_yaml(tmp_path, monkeypatch, value):
+    path = tmp_path / "config.yaml"
+    write_yaml(path, "${TW_KEY}")
+    monkeypatch.setenv("TW_KEY", value)
+    assert Config.from_yaml(path).twitter.api_key == value
+
+
+def test_from_yaml_leaves_unset_vars_untouched(tmp_path, monkeypatch):
+    monkeypatch.delenv("NOT_SET_ANYWHERE", raising=False)
+    path = tmp_path / "config.yaml"
+    write_yaml(path, "prefix-${NOT_SET_ANYWHERE}")
+    assert Config.from_yaml(path).twitter.api_key == "prefix-${NOT_SET_ANYWHERE}"
+
+
+def test_to_dict_returns_independent_copies():
+    config = Config(twitter={"api_key": "key", "api_secret": "secret"})
+    first = config.to_dict()
+    first["twitter"]["api_key"] = "changed"
+    assert config.to_dict()["twitter"]["api_key"] == "key"
+
+
+def test_copy_with_validates_update_and_stays_frozen():
+    config = Config(twitter={"api_key": "key", "api_secret": "secret"})
+    updated = config.copy_with({"facebook": {"api_key": "fb", "api_secret": "fb-secret"}})
+    assert updated.facebook.api_key == "fb"
+    assert updated.twitter == config.twitter
+    assert config.facebook is None
+    assert updated.to_dict()["facebook"] == {"api_key": "fb", "api_secret": "fb-secret"}
+    with pytest.raises(Exception):
+        updated.twitter = None
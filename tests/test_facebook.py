@@ -0,0 +1,214 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pluseposter.config import PlatformConfig
+from pluseposter.platforms import facebook
+from pluseposter.platforms.facebook import FacebookPlatform, RateLimiter, _retry_after
+from pluseposter.session import close_session
+
+
+def make_platform() -> FacebookPlatform:
+    return FacebookPlatform(PlatformConfig(api_key="key", api_secret="secret"))
+
+
+def make_response_error(headers) -> aiohttp.ClientResponseError:
+    return aiohttp.ClientResponseError(None, (), status=429, headers=headers)
+
+
+def test_retry_after_reads_seconds_from_response_error():
+    assert _retry_after(make_response_error({"Retry-After": "2.5"})) == 2.5
+
+
+def test_retry_after_ignores_missing_or_date_headers():
+    assert _retry_after(make_response_error({})) is None
+    assert _retry_after(make_response_error({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) is None
+    assert _retry_after(Exception("no headers")) is None
+
+
+def test_video_upload_429_pauses_limiter_then_retries(tmp_path, monkeypatch):
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"\x00" * 64)
+    hits = []
+
+    async def handler(request):
+        await request.read()
+        hits.append(request.headers.get("Authorization"))
+        if len(hits) == 1:
+            return web.json_response(
+                {"error": "throttled"}, status=429, headers={"Retry-After": "0.2"}
+            )
+        return web.json_response({"id": "v1"})
+
+    pauses = []
+    original_pause = RateLimiter.pause
+
+    def recording_pause(self, seconds):
+        pauses.append(seconds)
+        original_pause(self, seconds)
+
+    monkeypatch.setattr(RateLimiter, "pause", recording_pause)
+    monkeypatch.setattr(facebook.random, "uniform", lambda low, high: 0.0)
+
+    async def run():
+        app = web.Application()
+        app.router.add_post("/me/videos", handler)
+        async with TestServer(app) as server:
+            monkeypatch.setattr(facebook, "GRAPH_VIDEO_URL", str(server.make_url("/me/videos")))
+            platform = make_platform()
+            try:
+                return await platform._upload_media_with_retry(str(video), "video")
+            finally:
+                await platform.close()
+                await close_session()
+
+    assert asyncio.run(run()) == "v1"
+    assert hits == ["Bearer key", "Bearer key"]
+    assert pauses == [0.2]
+
+
+def test_rate_limiter_serves_burst_then_waits_for_debt():
+    async def run():
+        limiter = RateLimiter(rate=100, capacity=2)
+        return [await limiter.acquire() for _ in range(3)]
+
+    first, second, third = asyncio.run(run())
+    assert first == second == 0.0
+    assert 0.0 < third <= 0.011  # one token of debt at 100 tokens/s
+
+
+def test_rate_limiter_pause_blocks_next_acquire():
+    async def run():
+        limiter = RateLimiter(rate=100, capacity=10)
+        limiter.pause(0.05)
+        return await limiter.acquire()
+
+    assert asyncio.run(run()) >= 0.05
+
+
+def test_rate_limiter_rejects_more_than_capacity():
+    async def run():
+        await RateLimiter(rate=1, capacity=2).acquire(3)
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+
+
+def fake_upload(platform, calls, delay=0.05, fail_first=False):
+    async def upload(file_path, media_type):
+        calls.append(file_path)
+        await asyncio.sleep(delay)
+        if fail_first and len(calls) == 1:
+            raise RuntimeError("upload failed")
+        return f"id{len(calls)}"
+
+    platform._upload_media_with_retry = upload
+
+
+def test_media_upload_is_shared_and_memoized(tmp_path):
+    image = tmp_path / "photo.png"
+    image.write_bytes(b"a")
+    platform = make_platform()
+    calls = []
+    fake_upload(platform, calls)
+
+    async def run():
+        results = await asyncio.gather(
+            *(platform._upload_media(str(image), "image") for _ in range(3))
+        )
+        return results, await platform._upload_media(str(image), "image")
+
+    results, again = asyncio.run(run())
+    assert results == ["id1", "id1", "id1"]
+    assert again == "id1"
+    assert len(calls) == 1
+
+
+def test_media_upload_restarts_when_owner_is_cancelled(tmp_path):
+    image = tmp_path / "photo.png"
+    image.write_bytes(b"a")
+    platform = make_platform()
+    calls = []
+    fake_upload(platform, calls)
+
+    async def run():
+        owner = asyncio.create_task(platform._upload_media(str(image), "image"))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(platform._upload_media(str(image), "image"))
+        await asyncio.sleep(0.01)
+        owner.cancel()
+        result = await waiter
+        return owner.cancelled(), result
+
+    owner_cancelled, result = asyncio.run(run())
+    assert owner_cancelled
+    assert result == "id2"
+    assert len(calls) == 2
+
+
+def test_media_upload_failures_are_not_cached(tmp_path):
+    image = tmp_path / "photo.png"
+    image.write_bytes(b"a")
+    platform = make_platform()
+    calls = []
+    fake_upload(platform, calls, delay=0, fail_first=True)
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            await platform._upload_media(str(image), "image")
+        return await platform._upload_media(str(image), "image")
+
+    assert asyncio.run(run()) == "id2"
+
+
+def test_media_upload_cache_misses_when_file_changes(tmp_path):
+    image = tmp_path / "photo.png"
+    image.write_bytes(b"a")
+    platform = make_platform()
+    calls = []
+    fake_upload(platform, calls, delay=0)
+
+    async def run():
+        first = await platform._upload_media(str(image), "image")
+        image.write_bytes(b"bb")
+        return first, await platform._upload_media(str(image), "image")
+
+    assert asyncio.run(run()) == ("id1", "id2")
+
+
+def test_scheduler_is_rebuilt_on_a_new_event_loop(monkeypatch):
+    posted = []
+
+    async def fake_post_impl(self, content_type, content, caption=None, **kwargs):
+        posted.append(content)
+        return {"success": True}
+
+    monkeypatch.setattr(FacebookPlatform, "_post_impl", fake_post_impl)
+    later = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    # Leave a scheduler task pending on another loop that is no longer running
+    old_loop = asyncio.new_event_loop()
+    stale = make_platform()
+    old_loop.run_until_complete(stale.post("text", "stale", scheduled_time=later))
+    stale_task = FacebookPlatform._scheduled_task
+
+    async def run():
+        platform = make_platform()
+        soon = datetime.now(timezone.utc) + timedelta(seconds=0.05)
+        await platform.post("text", "fresh", scheduled_time=soon)
+        await asyncio.sleep(0.2)
+        await stale.close()
+        await platform.close()
+
+    try:
+        asyncio.run(run())
+    finally:
+        stale_task.cancel()
+        old_loop.run_until_complete(asyncio.gather(stale_task, return_exceptions=True))
+        old_loop.close()
+    assert posted == ["fresh"]
+    assert FacebookPlatform._scheduled_posts == []
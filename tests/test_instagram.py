@@ -0,0 +1,66 @@
+import os
+
+import pytest
+from PIL import Image
+
+from pluseposter.platforms import instagram
+from pluseposter.platforms.instagram import _probe_image
+
+
+@pytest.fixture(autouse=True)
+def clear_probe_cache():
+    instagram._image_probe_cache.clear()
+    yield
+    instagram._image_probe_cache.clear()
+
+
+def save_image(path, size, fmt):
+    Image.new("RGB", size, "red").save(path, fmt)
+    return str(path)
+
+
+@pytest.fixture
+def no_pil(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("header probe should not need PIL")
+
+    monkeypatch.setattr(instagram.Image, "open", fail)
+
+
+@pytest.mark.parametrize("fmt, suffix", [("PNG", "png"), ("JPEG", "jpg")])
+def test_probe_reads_png_and_jpeg_headers_without_pil(tmp_path, no_pil, fmt, suffix):
+    path = save_image(tmp_path / f"img.{suffix}", (320, 200), fmt)
+    assert _probe_image(path) == (320, 200, fmt)
+
+
+def test_probe_jpeg_skips_leading_segments(tmp_path, no_pil):
+    path = tmp_path / "exif.jpg"
+    Image.new("RGB", (64, 48)).save(path, "JPEG", exif=b"Exif\x00\x00" + b"\x00" * 32, dpi=(72, 72))
+    assert _probe_image(str(path)) == (64, 48, "JPEG")
+
+
+def test_probe_falls_back_to_pil_for_other_formats(tmp_path):
+    path = save_image(tmp_path / "img.gif", (10, 20), "GIF")
+    assert _probe_image(path) == (10, 20, "GIF")
+
+
+def test_probe_returns_none_for_unreadable_files(tmp_path):
+    path = tmp_path / "broken.jpg"
+    path.write_bytes(b"not an image")
+    assert _probe_image(str(path)) is None
+
+
+def test_probe_cache_is_keyed_on_file_changes(tmp_path, monkeypatch):
+    path = save_image(tmp_path / "img.png", (100, 50), "PNG")
+    assert _probe_image(path) == (100, 50, "PNG")
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("cached probe reopened the file")
+
+    monkeypatch.setattr("builtins.open", fail_open)
+    assert _probe_image(path) == (100, 50, "PNG")
+    monkeypatch.undo()
+
+    save_image(path, (30, 60), "PNG")
+    os.utime(path, (0, os.stat(path).st_mtime + 10))
+    assert _probe_image(path) == (30, 60, "PNG")
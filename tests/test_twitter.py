@@ -0,0 +1,146 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pluseposter.config import PlatformConfig
+from pluseposter.platforms import twitter
+from pluseposter.platforms.twitter import TwitterPlatform
+from pluseposter.session import close_session
+
+
+class FakeTwitter:
+    """Local stand-in for the media upload and tweet endpoints"""
+
+    def __init__(self, fail_segment=None):
+        self.fail_segment = fail_segment
+        self.commands = []
+        self.segments = {}
+        self.simple_uploads = []
+        self.tweets = []
+
+    async def media_upload(self, request):
+        if request.content_type == "multipart/form-data":
+            form = await request.post()
+            media = form["media"]
+            self.simple_uploads.append((media.filename, media.content_type, media.file.read()))
+            return web.json_response({"media_id_string": "simple"})
+
+        command = request.query["command"]
+        self.commands.append(command)
+        if command == "INIT":
+            return web.json_response({"media_id_string": "chunked"})
+        if command == "APPEND":
+            segment_index = int(request.query["segment_index"])
+            if segment_index == self.fail_segment:
+                return web.json_response({"error": "bad segment"}, status=400)
+            await asyncio.sleep(0.01)
+            self.segments[segment_index] = await request.read()
+            return web.Response(status=204)
+        return web.json_response({"media_id": "chunked"})
+
+    async def tweet(self, request):
+        self.tweets.append(await request.json())
+        return web.json_response({"data": {"id": "t1"}}, status=201)
+
+
+def run_against(fake, monkeypatch, coro_fn):
+    async def run():
+        app = web.Application()
+        app.router.add_post("/media/upload.json", fake.media_upload)
+        app.router.add_post("/2/tweets", fake.tweet)
+        async with TestServer(app) as server:
+            monkeypatch.setattr(TwitterPlatform, "MEDIA_UPLOAD_URL", str(server.make_url("/media/upload.json")))
+            monkeypatch.setattr(TwitterPlatform, "API_URL", str(server.make_url("/2")))
+            platform = TwitterPlatform(PlatformConfig(api_key="key", api_secret="secret"))
+            try:
+                return await coro_fn(platform)
+            finally:
+                await close_session()
+
+    return asyncio.run(run())
+
+
+def test_small_image_uses_single_request(tmp_path, monkeypatch):
+    image = tmp_path / "photo.png"
+    image.write_bytes(b"\x89PNG" + b"\x00" * 100)
+    fake = FakeTwitter()
+
+    media_id = run_against(fake, monkeypatch, lambda p: p._upload_media(str(image)))
+
+    assert media_id == "simple"
+    assert fake.simple_uploads == [("photo.png", "image/png", image.read_bytes())]
+    assert fake.commands == []
+
+
+def test_video_uses_chunked_upload_in_order(tmp_path, monkeypatch):
+    monkeypatch.setattr(twitter, "CHUNK_SIZE", 10)
+    video = tmp_path / "clip.mp4"
+    data = bytes(range(95))
+    video.write_bytes(data)
+    fake = FakeTwitter()
+
+    media_id = run_against(fake, monkeypatch, lambda p: p._upload_media(str(video)))
+
+    assert media_id == "chunked"
+    assert fake.commands[0] == "INIT" and fake.commands[-1] == "FINALIZE"
+    assert sorted(fake.segments) == list(range(10))
+    assert b"".join(fake.segments[i] for i in range(10)) == data
+
+
+def test_failed_append_stops_further_segments(tmp_path, monkeypatch):
+    monkeypatch.setattr(twitter, "CHUNK_SIZE", 10)
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"\x00" * 400)  # 40 segments
+    fake = FakeTwitter(fail_segment=0)
+
+    with pytest.raises(Exception, match="400"):
+        run_against(fake, monkeypatch, lambda p: p._upload_media(str(video)))
+
+    # Only the segments already in flight when segment 0 failed were sent
+    assert fake.commands.count("APPEND") <= twitter.APPEND_CONCURRENCY + 1
+    assert "FINALIZE" not in fake.commands
+
+
+def test_post_truncates_text_by_weighted_length(monkeypatch):
+    fake = FakeTwitter()
+
+    result = run_against(fake, monkeypatch, lambda p: p.post("text", "字" * 200))
+
+    assert result == {"data": {"id": "t1"}}
+    assert fake.tweets == [{"text": "字" * 140}]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("short", "short"),
+        ("a" * 280, "a" * 280),
+        ("a" * 281, "a" * 280),
+        ("字" * 141, "字" * 140),
+        ("a" * 279 + "\u00e9", "a" * 279 + "\u00e9"),
+        # Combining accent: drop the base letter with it
+        ("a" * 279 + "e\u0301", "a" * 279),
+        # Flag: two regional indicators, never split
+        ("a" * 277 + "\U0001F1FA\U0001F1F8", "a" * 277),
+        ("a" * 276 + "\U0001F1FA\U0001F1F8" + "\U0001F1EB\U0001F1F7", "a" * 276 + "\U0001F1FA\U0001F1F8"),
+        # ZWJ family emoji is dropped whole
+        ("a" * 275 + "\U0001F468\u200d\U0001F469\u200d\U0001F467", "a" * 275),
+        # Keycap: digit + variation selector + combining keycap
+        ("a" * 278 + "1\ufe0f\u20e3", "a" * 278),
+        # Skin tone modifier stays with its emoji
+        ("a" * 277 + "\U0001F44D\U0001F3FD", "a" * 277),
+        # 0x2000-0x200D are light, so 280 en spaces fit
+        ("\u2002" * 281, "\u2002" * 280),
+    ],
+)
+def test_truncate_tweet(text, expected):
+    assert twitter._truncate_tweet(text) == expected
+
+
+def test_truncate_tweet_weights():
+    assert twitter._char_weight("a") == 1
+    assert twitter._char_weight("\u2002") == 1
+    assert twitter._char_weight("字") == 2
+    assert twitter._char_weight("\U0001F600") == 2